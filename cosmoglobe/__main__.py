@@ -1,18 +1,75 @@
-import click
+import importlib
 
-from cosmoglobe.fits.click_fits import commands_fits
-from cosmoglobe.release.commands_hdf import commands_hdf
-from cosmoglobe.h5.click_h5 import commands_h5
-from cosmoglobe.plot.click_plotting import commands_plotting
+import click
 
 CONTEXT_SETTINGS = dict(max_content_width=100)
 
-@click.group(context_settings=CONTEXT_SETTINGS)
-def cli():
-    pass
+# The command groups are registered here by name only, and the module
+# defining a group is imported the first time one of its commands is
+# invoked. Importing them all up front drags in matplotlib, healpy and
+# astropy, which costs seconds just to print `cosmoglobe --help`.
+# Sources are listed in precedence order: when a command name appears in
+# several groups (e.g. `plot`), the first listed group wins, matching
+# the old click.CommandCollection behaviour.
+LAZY_SOURCES = [
+    (
+        "cosmoglobe.plot.click_plotting",
+        "commands_plotting",
+        ["gnom", "plot", "trace"],
+    ),
+    (
+        "cosmoglobe.h5.click_h5",
+        "commands_h5",
+        ["combine-chains", "copy-chain", "mean", "stddev"],
+    ),
+    (
+        "cosmoglobe.fits.click_fits",
+        "commands_fits",
+        ["fittemp", "printdata", "printheader", "rmcolumn", "rmmd"],
+    ),
+    (
+        "cosmoglobe.release.commands_hdf",
+        "commands_hdf",
+        [
+            "alm2fits",
+            "h52fits",
+            "mean",
+            "release",
+            "sigma-l2fits",
+            "split",
+            "stddev",
+        ],
+    ),
+]
+
+COMMAND_SOURCES = {}
+for module_name, group_name, command_names in LAZY_SOURCES:
+    for command_name in command_names:
+        COMMAND_SOURCES.setdefault(command_name, (module_name, group_name))
+
+
+class LazyGroup(click.Group):
+    """Click group deferring subcommand imports until a command is run."""
+
+    def list_commands(self, ctx):
+        return sorted(COMMAND_SOURCES)
+
+    def get_command(self, ctx, name):
+        try:
+            module_name, group_name = COMMAND_SOURCES[name]
+        except KeyError:
+            return None
+        group = getattr(importlib.import_module(module_name), group_name)
+        return group.get_command(ctx, name)
+
+    def format_commands(self, ctx, formatter):
+        # The default implementation imports every command module to
+        # fetch short help texts, which would defeat the lazy loading.
+        with formatter.section("Commands"):
+            formatter.write_dl([(name, "") for name in self.list_commands(ctx)])
+
 
-cli = click.CommandCollection(sources=[commands_plotting, commands_h5, commands_fits, commands_hdf], context_settings=CONTEXT_SETTINGS)
+cli = LazyGroup(context_settings=CONTEXT_SETTINGS)
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     cli()
-    
@@ -1,6 +1,8 @@
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 
 import h5py
+import healpy as hp
 import numpy as np
 from numba import njit
 
@@ -11,6 +13,18 @@ if TYPE_CHECKING:
     from cosmoglobe.h5.chain import Chain
 
 
+@lru_cache(maxsize=32)
+def _get_lmax_from_chain(path: str, lmax_key: str) -> int:
+    """Reads (and memoizes) the lmax of an alm group in a chainfile.
+
+    The lmax is requested once per alm read, so caching it saves one
+    HDF5 file open per extracted alm array.
+    """
+
+    with h5py.File(path, "r") as file:
+        return file[lmax_key][()]
+
+
 def unpack_alms_from_chain(chain: "Chain", alms: np.ndarray, key: str) -> np.ndarray:
     """Unpacks alms from a chain."""
 
@@ -21,8 +35,7 @@ def unpack_alms_from_chain(chain: "Chain", alms: np.ndarray, key: str) -> np.nda
         lmax_key = f"{chain.samples[0]}/{key[:-3]}lmax"
 
     try:
-        with h5py.File(chain.path, "r") as file:
-            lmax = file[lmax_key][()]
+        lmax = _get_lmax_from_chain(str(chain.path), lmax_key)
     except KeyError:
         raise ChainKeyError(
             f"{lmax_key} does not exist. Cannot unpack alms from chain "
@@ -35,7 +48,50 @@ def unpack_alms_from_chain(chain: "Chain", alms: np.ndarray, key: str) -> np.nda
     return unpack_alms(alms, lmax)
 
 
-@njit
+@lru_cache(maxsize=16)
+def _alm_index_tables(lmax: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Gather tables mapping healpy alm indices into the Commander layout.
+
+    The Commander chain packs the real and imaginary parts of an (l, m)
+    coefficient at flat indices l^2 + l + m and l^2 + l - m. The tables
+    are purely a function of lmax and are memoized, so the unpacking
+    reduces to a gather instead of recomputing the index arithmetic per
+    coefficient.
+    """
+
+    ls, ms = hp.Alm.getlm(lmax)
+    j_real = ls * ls + ls + ms
+    j_imag = ls * ls + ls - ms
+    inv_sqrt2 = 1.0 / np.sqrt(2.0)
+    factor_real = np.where(ms == 0, 1.0, inv_sqrt2)
+    factor_imag = np.where(ms == 0, 0.0, inv_sqrt2)
+
+    return j_real, j_imag, factor_real, factor_imag
+
+
+@njit(cache=True)
+def _unpack_alms_kernel(data, j_real, j_imag, factor_real, factor_imag):
+    """Gathers the packed Commander alms into healpy ordering per sigma.
+
+    The kernel is deliberately serial: the sigma axis is at most three
+    rows, and the component factory already calls the unpacking from
+    worker threads, which numba's default threading layer does not
+    support for parallel kernels.
+    """
+
+    n = data.shape[0]
+    n_alms = j_real.size
+    alms = np.empty((n, n_alms), dtype=np.complex128)
+    for sigma in range(n):
+        for i in range(n_alms):
+            alms[sigma, i] = complex(
+                data[sigma, j_real[i]] * factor_real[i],
+                data[sigma, j_imag[i]] * factor_imag[i],
+            )
+
+    return alms
+
+
 def unpack_alms(data, lmax):
     """Unpacks alms from the Commander chain output.
 
@@ -55,28 +111,4 @@ def unpack_alms(data, lmax):
         Unpacked version of the Commander alms (2-dimensional array)
     """
 
-    n = len(data)
-    n_alms = int(lmax * (2 * lmax + 1 - lmax) / 2 + lmax + 1)
-    alms = np.zeros((n, n_alms), dtype=np.complex128)
-
-    for sigma in range(n):
-        i = 0
-        for l in range(lmax + 1):
-            j_real = l ** 2 + l
-            alms[sigma, i] = complex(data[sigma, j_real], 0.0)
-            i += 1
-
-        for m in range(1, lmax + 1):
-            for l in range(m, lmax + 1):
-                j_real = l ** 2 + l + m
-                j_comp = l ** 2 + l - m
-                alms[sigma, i] = (
-                    complex(
-                        data[sigma, j_real],
-                        data[sigma, j_comp],
-                    )
-                    / np.sqrt(2.0)
-                )
-                i += 1
-
-    return alms
+    return _unpack_alms_kernel(np.atleast_2d(data), *_alm_index_tables(int(lmax)))
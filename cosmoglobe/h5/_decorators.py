@@ -1,7 +1,5 @@
 from functools import wraps
 
-import h5py
-
 from cosmoglobe.h5 import PARAMETER_GROUP_NAME
 from cosmoglobe.h5._alms import unpack_alms_from_chain
 from cosmoglobe.h5._exceptions import ChainKeyError, ChainSampleError
@@ -20,11 +18,15 @@ def validate_key(func):
         else:
             path = f"{chain.samples[0]}/{key}"
 
-        with h5py.File(chain.path, "r") as file:
-            try:
-                file[path]
-            except KeyError:
-                raise ChainKeyError(f"{key=} not found in chain")
+        # The chainfile is read-only, so keys that validated once are
+        # cached on the chain and skip the file open on repeat accesses.
+        if path not in chain._valid_keys:
+            with chain._open() as file:
+                try:
+                    file[path]
+                except KeyError:
+                    raise ChainKeyError(f"{key=} not found in chain")
+            chain._valid_keys.add(path)
         return func(*args, **kwargs)
 
     return wrapper
@@ -13,6 +13,7 @@ from cosmoglobe.h5._alms import unpack_alms as unpack_alms_
 from cosmoglobe.h5._alms import unpack_alms_from_chain
 from cosmoglobe.h5._decorators import unpack_alms, validate_key, validate_samples
 from cosmoglobe.h5._exceptions import ChainFormatError, ChainKeyError, ChainSampleError
+from cosmoglobe.sky._sht import alm2map as alm2map_
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 
 
@@ -79,6 +80,10 @@ class Chain:
         self._parameters = parameters
         self._path = path
         self._version = version
+        # Keys that have been confirmed to exist in the chainfile. The
+        # file is read-only, so a key that validated once stays valid;
+        # caching the outcome lets repeat accesses skip a file open.
+        self._valid_keys: set[str] = set()
 
     @property
     def samples(self) -> list[str]:
@@ -116,6 +121,19 @@ class Chain:
 
         return self._version
 
+    def _open(self) -> h5py.File:
+        """Opens the chainfile for reading with a tuned chunk cache.
+
+        The h5py default chunk cache (1 MB) is smaller than typical
+        chainfile chunks, so every read of a cached-out chunk hits disk.
+        A larger cache lets repeated reads of the same groups (e.g. the
+        per-sample loops in `mean` and `stddev`) stay in memory.
+        """
+
+        return h5py.File(
+            self.path, "r", rdcc_nbytes=64 * 1024 ** 2, rdcc_nslots=5003
+        )
+
     @property
     def tree(self):
         """Prints group and dataset structure of the chainfile."""
@@ -128,7 +146,7 @@ class Chain:
             item_name = path[-1]
             print(space + item_name)
 
-        with h5py.File(self.path, "r") as file:
+        with self._open() as file:
             file.visititems(print_attrs)
 
     @validate_key
@@ -161,10 +179,20 @@ class Chain:
             The value of the key for each samples.
         """
 
-        with h5py.File(self.path, "r") as file:
-            values = [file[f"{sample}/{key}"][()] for sample in samples]
+        with self._open() as file:
+            dset = file[f"{samples[0]}/{key}"]
+            if dset.shape == ():
+                values = [file[f"{sample}/{key}"][()] for sample in samples]
+                return np.asarray(values) if len(values) != 1 else values[0]
+
+            # read_direct fills the preallocated stack row by row, skipping
+            # the per-sample allocations of h5py's generic fancy-read path.
+            values = np.empty((len(samples), *dset.shape), dtype=dset.dtype)
+            dset.read_direct(values[0])
+            for idx, sample in enumerate(samples[1:], start=1):
+                file[f"{sample}/{key}"].read_direct(values[idx])
 
-        return np.asarray(values) if len(values) != 1 else values[0]
+        return values if len(samples) != 1 else values[0]
 
     @validate_key
     @validate_samples
@@ -195,13 +223,27 @@ class Chain:
         value
             The averaged value of the key over all samples.
         """
-        with h5py.File(self.path, "r") as file:
-            value = file[f"{samples[0]}/{key}"][()]
-            dtype = value.dtype.type
-            if len(samples) > 1:
+        with self._open() as file:
+            dset = file[f"{samples[0]}/{key}"]
+            if dset.shape == ():
+                value = dset[()]
+                dtype = value.dtype.type
                 for sample in samples[1:]:
                     value += file[f"{sample}/{key}"][()]
-        return dtype(value / len(samples))  # Converting back to original dtype
+                return dtype(value / len(samples))
+
+            # Stream the samples through a single reused scratch buffer
+            # into a float64 accumulator rather than allocating a fresh
+            # array per sample.
+            dtype = dset.dtype.type
+            acc = np.zeros(dset.shape, dtype=np.float64)
+            scratch = np.empty(dset.shape, dtype=dset.dtype)
+            for sample in samples:
+                file[f"{sample}/{key}"].read_direct(scratch)
+                np.add(acc, scratch, out=acc)
+
+        acc *= 1.0 / len(samples)
+        return dtype(acc)  # Converting back to original dtype
 
     @validate_key
     @validate_samples
@@ -229,36 +271,45 @@ class Chain:
             The averaged value of the key over all samples.
         """
 
-        with h5py.File(self.path, "r") as file:
-            value = file[f"{samples[0]}/{key}"][()]
-            dtype = value.dtype.type
-            if len(samples) > 1:
-                for sample in samples[1:]:
-                    value += file[f"{sample}/{key}"][()]
-        mu = dtype(value / len(samples))  # Converting back to original dtype
-
-        # Calculate in map-space if alm2map
-        if alm2map:
-            comp, quantity = key.split("/")
-            nside = self.parameters[comp]["nside"]
-            pol = True if quantity.startswith("amp") else False
-            fwhm = self.parameters[comp]["fwhm"]
-            lmax = 3*nside
-            mu = hp.alm2map(unpack_alms_(mu, lmax), nside=nside, lmax=lmax, fwhm=fwhm, pol=pol, pixwin=True,)
-
-
-        with h5py.File(self.path, "r") as file: 
-            x = file[f"{samples[0]}/{key}"][()] 
-            if alm2map: x = hp.alm2map(unpack_alms_(x, lmax), nside=nside, lmax=lmax, fwhm=fwhm, pol=pol, pixwin=True,)
-            dtype = x.dtype.type
-            numerator = (x - mu)**2
-            if len(samples) > 1:
-                for sample in samples[1:]:
-                    x = file[f"{sample}/{key}"][()]
-                    if alm2map: x = hp.alm2map(unpack_alms_(x, lmax), nside=nside, lmax=lmax, fwhm=fwhm, pol=pol, pixwin=True,)
-                    numerator += (x - mu)**2
-
-        return dtype(np.sqrt(numerator/len(samples)))  # Converting back to original dtype
+        with self._open() as file:
+            # Resolve each sample's dataset once; both passes below reuse
+            # the handles rather than redoing the path lookup per access.
+            dsets = [file[f"{sample}/{key}"] for sample in samples]
+            dtype = dsets[0].dtype.type
+            acc = np.zeros(dsets[0].shape, dtype=np.float64)
+            scratch = np.empty(dsets[0].shape, dtype=dsets[0].dtype)
+            for dset in dsets:
+                dset.read_direct(scratch)
+                np.add(acc, scratch, out=acc)
+            acc *= 1.0 / len(samples)
+            mu = dtype(acc)  # Converting back to original dtype
+
+            # Calculate in map-space if alm2map
+            if alm2map:
+                comp, quantity = key.split("/")
+                nside = self.parameters[comp]["nside"]
+                pol = True if quantity.startswith("amp") else False
+                fwhm = self.parameters[comp]["fwhm"]
+                lmax = 3*nside
+                # The per-sample syntheses go through the ducc0 wrapper, which
+                # fuses the polarized triple into one spin-0 + spin-2 pass.
+                mu = alm2map_(unpack_alms_(mu, lmax), nside=nside, lmax=lmax, fwhm=fwhm, pol=pol, pixwin=True)
+
+            numerator = None
+            for dset in dsets:
+                dset.read_direct(scratch)
+                x = scratch
+                if alm2map: x = alm2map_(unpack_alms_(x, lmax), nside=nside, lmax=lmax, fwhm=fwhm, pol=pol, pixwin=True)
+                if numerator is None:
+                    dtype = x.dtype.type
+                    numerator = np.zeros(x.shape, dtype=np.float64)
+                    diff = np.empty(x.shape, dtype=np.float64)
+                np.subtract(x, mu, out=diff)
+                np.multiply(diff, diff, out=diff)
+                np.add(numerator, diff, out=numerator)
+
+        numerator *= 1.0 / len(samples)
+        return dtype(np.sqrt(numerator, out=numerator))  # Converting back to original dtype
 
     @validate_key
     @validate_samples
@@ -287,9 +338,14 @@ class Chain:
             A generator that can be looped over to yield each sampled value.
         """
 
-        with h5py.File(self.path, "r") as file:
+        with self._open() as file:
             for sample in samples:
-                value = file[f"{sample}/{key}"][()]
+                dset = file[f"{sample}/{key}"]
+                if dset.shape == ():
+                    value = dset[()]
+                else:
+                    value = np.empty(dset.shape, dtype=dset.dtype)
+                    dset.read_direct(value)
                 if "alm" in key:
                     value = unpack_alms_from_chain(self, value, key)
 
@@ -313,7 +369,7 @@ class Chain:
             The value of the key.
         """
 
-        with h5py.File(self.path, "r") as file:
+        with self._open() as file:
             item = file[key]
             if isinstance(item, h5py.Group):
                 return list(item.keys())
@@ -1,7 +1,17 @@
-from .skymap import plot
+from functools import partial
+
+from .skymap import plot, plot_batch
 from .gnomonic import gnom
 from .histogram import hist
 from .traceplot import trace
 from .spectrum import spec
-from .plottools import standalone_colorbar
+from .plottools import standalone_colorbar, _load_autoparams
 from .temp_newvisufunc import projview
+
+# Specialized wrappers with the component label pre-bound, one per entry
+# in autoparams.json: plot_cmb(m) is plot(m, comp="cmb"), plot_dust_beta(m)
+# is plot(m, comp="dust beta"), and so on. Handy in scripts that plot one
+# component repeatedly.
+for _comp in _load_autoparams():
+    globals()[f"plot_{_comp.replace(' ', '_')}"] = partial(plot, comp=_comp)
+del _comp
@@ -1,5 +1,7 @@
 # This file contains useful functions used across different plotting scripts.
 from cmath import inf
+from copy import deepcopy
+from functools import lru_cache
 from re import A, T
 import warnings
 
@@ -7,6 +9,7 @@ from numpy.core.numeric import NaN
 from .. import data as data_dir
 from cosmoglobe.sky.model import SkyModel
 from cosmoglobe.h5.chain import Chain
+from cosmoglobe.sky._sht import alm2map, smoothing
 from cosmoglobe.sky._units import cmb_equivalencies, Unit
 
 import cmasher
@@ -178,8 +181,15 @@ def get_percentile(m, percentile):
     This function gets appropriate min and max
     values of the data for a given percentile
     """
-    vmin = np.percentile(m[~m.mask], 100.0 - percentile)
-    vmax = np.percentile(m[~m.mask], percentile)
+    values = m.compressed() if np.ma.isMaskedArray(m) else np.asarray(m).ravel()
+    # A single two-sided np.partition is O(N) where np.percentile sorts;
+    # for full-sky maps the selection is the dominant cost of the tick
+    # autodetection.
+    lower = round((100.0 - percentile) / 100.0 * (values.size - 1))
+    upper = round(percentile / 100.0 * (values.size - 1))
+    values = np.partition(values, (lower, upper))
+    vmin = values[lower]
+    vmax = values[upper]
 
     vmin = 0.0 if abs(vmin) < 1e-5 else vmin
     vmax = 0.0 if abs(vmax) < 1e-5 else vmax
@@ -563,7 +573,7 @@ def load_cmap(cmap):
 
 
 def get_data(input, sig, comp, freq, fwhm, nside=None, sample=-1, scale=1,
-    remove_mono=None, remove_dip=None, nest=False, gal_cut=0):
+    remove_mono=None, remove_dip=None, nest=False, gal_cut=0, dtype=None):
     # Parsing component string
     fwhm_ = None
     specparam = "amp"
@@ -595,12 +605,11 @@ def get_data(input, sig, comp, freq, fwhm, nside=None, sample=-1, scale=1,
                         nside = chain.parameters[comp]["nside"]
                     pol = True if specparam == "amp" and alms.shape[0] == 3 else False
                     # PROBLEM! Get issue with nside when udgrading directly to low nside
-                    data = hp.alm2map(
+                    data = alm2map(
                         alms,
                         nside=nside,
                         fwhm=fwhm_.to(u.rad).value,
                         lmax=lmax,
-                        mmax=lmax,
                         pol=pol,
                     )
 
@@ -660,12 +669,15 @@ def get_data(input, sig, comp, freq, fwhm, nside=None, sample=-1, scale=1,
         else:
             m = m[sig]
 
-    m = hp.ma(m)
-
     # Convert astropy map to numpy array
     if isinstance(m, u.Quantity):
         m = m.value
 
+    # Mask UNSEEN pixels. Unlike hp.ma, this shares the data buffer with
+    # the input instead of copying the full map.
+    m = np.asarray(m)
+    m = np.ma.array(m, mask=hp.mask_bad(m), copy=False, fill_value=hp.UNSEEN)
+
     # ud_grade map
     if nside is not None and nside != hp.get_nside(m):
         print("ud_grading map")
@@ -673,7 +685,7 @@ def get_data(input, sig, comp, freq, fwhm, nside=None, sample=-1, scale=1,
 
     # Smooth map
     if fwhm > 0.0 and fwhm_ is None:
-        m = hp.smoothing(m, fwhm.to(u.rad).value)
+        m = smoothing(m, fwhm.to(u.rad).value)
 
     # Rescale map
     m = m * scale
@@ -688,10 +700,22 @@ def get_data(input, sig, comp, freq, fwhm, nside=None, sample=-1, scale=1,
            gal_cut = 30
         m = hp.remove_monopole(m, gal_cut=gal_cut, nest=nest, copy=True)
 
+    # Store the map at the requested (typically single) precision; the
+    # transforms above are done at input precision.
+    if dtype is not None:
+        m = m.astype(dtype, copy=False)
 
     return m, comp, freq, hp.get_nside(m)
 
 
+@lru_cache(maxsize=1)
+def _load_autoparams():
+    """Reads (and memoizes) the autoparams json file."""
+
+    with open(Path(data_dir.__path__[0]) / "autoparams.json", "r") as f:
+        return json.load(f)
+
+
 def get_params(**params):
     """
     This parses the autoparams json file for automatically setting parameters
@@ -704,8 +728,9 @@ def get_params(**params):
 
     # Autoset plotting parameters if component is specified
     if params["comp"] is not None:
-        with open(Path(data_dir.__path__[0]) / "autoparams.json", "r") as f:
-            autoparams = json.load(f)
+        # The parsed file is cached; the copy keeps the in-place tick
+        # edits below from leaking into later calls.
+        autoparams = deepcopy(_load_autoparams())
         try:
             autoparams = autoparams[params["comp"]]
         except KeyError:
@@ -1,5 +1,6 @@
 import warnings
 import os
+from functools import lru_cache
 
 from rich import print
 import healpy as hp
@@ -16,6 +17,23 @@ from .temp_newvisufunc import projview as temp_projview
 os.environ["KMP_DUPLICATE_LIB_OK"] = "True"
 
 
+@lru_cache(maxsize=8)
+def _load_mask(path, nside):
+    """Reads (and memoizes) a mask file regraded to the requested nside.
+
+    Frequency sweeps call plot() once per frame with the same mask file;
+    caching skips the fits read and regrade per frame. The cached mask is
+    bit-packed, so it holds npix/8 bytes instead of a full bool map.
+    """
+
+    mask = hp.read_map(path)
+    if hp.get_nside(mask) != nside:
+        # float32 dodges the uint8 ud_grade bug, see plot() below.
+        mask = hp.ud_grade(mask.astype(np.float32, copy=False), nside)
+
+    return np.packbits(mask.astype(bool, copy=False))
+
+
 @u.quantity_input(freq=u.Hz, fwhm=(u.arcmin, u.rad, u.deg))
 def plot(
     input,
@@ -71,6 +89,7 @@ def plot(
     extend=None,
     return_figure=False,
     scale=1,
+    dtype=np.float32,
     **kwargs,
 ):
     """
@@ -214,6 +233,11 @@ def plot(
         override y-axis tick labels
     scale : float
         rescales data by factor scale
+    dtype : numpy dtype, optional
+        dtype the map is stored in while plotting. float32 halves the
+        memory traffic and is lossless once the colormap quantizes the
+        data; pass None to keep the input precision.
+        default: np.float32
     kwargs : keywords
         passed to projview
     """
@@ -241,16 +265,21 @@ def plot(
     # Get data
     m, comp, freq, nside = get_data(input, sig, comp, freq, fwhm, nside=nside,
         sample=sample, scale=scale, remove_dip=remove_dip,
-        remove_mono=remove_mono)
+        remove_mono=remove_mono, dtype=dtype)
 
     if mask is not None:
         if isinstance(mask, str):
-            mask = hp.read_map(mask)
+            mask = np.unpackbits(
+                _load_mask(mask, nside), count=hp.nside2npix(nside)
+            ).view(bool)
 
         if hp.get_nside(mask) != nside:
             print("[magenta]Input mask nside is different, ud_grading to output nside.[/magenta]")
-            mask = hp.ud_grade(mask, nside)
-        m.mask = np.logical_not(mask)
+            # ud_grade silently zeroes uint8 masks (as read from Planck
+            # fits files) and otherwise averages in float64; regrading in
+            # float32 is correct and halves the memory traffic.
+            mask = hp.ud_grade(mask.astype(np.float32, copy=False), nside)
+        m.mask = ~mask.astype(bool, copy=False)
 
     # Pass all your arguments in, return parsed plotting parameters
     params = get_params(
@@ -329,3 +358,39 @@ def plot(
        return ret, params
     else:
        return ret
+
+
+def plot_batch(input, freqs, *, sig=0, comp=None, fwhm=0.0 * u.arcmin,
+    nside=None, sample=-1, scale=1, xsize=1000, rot=None, coord=None,
+    nest=False, **kwargs):
+    """Plots the same sky over a sequence of frequencies reusing one figure.
+
+    The first frequency goes through plot() to set up the figure, colorbar
+    and ticks; every following frequency only recomputes the map and swaps
+    the projected data into the existing mesh, reusing the cached
+    projection pixel lookup. Yields (freq, figure) pairs so frames can be
+    saved as they are produced:
+
+    >>> for freq, fig in plot_batch(model, freqs, comp="cmb"): # doctest: +SKIP
+    ...     fig.savefig(f"cmb_{freq.value:.0f}.png")
+
+    The color scale is fixed by the first frame, which keeps frames
+    comparable in movie-style output.
+    """
+
+    mesh = None
+    for freq in freqs:
+        if mesh is None:
+            mesh, _ = plot(input, sig=sig, comp=comp, freq=freq, fwhm=fwhm,
+                nside=nside, sample=sample, scale=scale, xsize=xsize,
+                rot=rot, coord=coord, nest=nest, return_figure=True, **kwargs)
+            fig = mesh.axes.figure
+        else:
+            m, *_ = get_data(input, sig, comp, freq, fwhm, nside=nside,
+                sample=sample, scale=scale)
+            _, _, grid_map = temp_projview(m, xsize=xsize, rot=rot,
+                coord=coord, nest=nest, return_only_data=True)
+            mesh.set_array(grid_map)
+            fig.canvas.draw_idle()
+
+        yield freq, fig
@@ -1,6 +1,9 @@
 __all__ = ["projview", "newprojplot"]
 
+from functools import lru_cache
+
 import numpy as np
+from numba import njit, prange
 from healpy.pixelfunc import ang2pix, npix2nside, remove_dipole, remove_monopole
 from healpy.rotator import Rotator, coordsys2euler_zyz
 import matplotlib.pyplot as plt
@@ -54,6 +57,59 @@ def lonlat(theta, phi):
     return longitude, latitude
 
 
+@njit(cache=True, parallel=True)
+def _finite_minmax(data, mask):
+    """Min and max of the finite, unmasked map values in a single pass.
+
+    Replaces the two full `m[w].min()` / `m[w].max()` reductions (and the
+    fancy-indexed copy they imply) with one threaded scan. `mask` may be
+    empty for plain arrays.
+    """
+
+    amin = np.inf
+    amax = -np.inf
+    masked = mask.size != 0
+    for i in prange(data.size):
+        if masked and mask[i]:
+            continue
+        value = data[i]
+        if np.isfinite(value):
+            amin = min(amin, value)
+            amax = max(amax, value)
+
+    return amin, amax
+
+
+def _rot_key(value):
+    """Hashable cache key for the rot/coord arguments"""
+
+    if isinstance(value, (list, np.ndarray)):
+        return tuple(np.asarray(value).ravel().tolist())
+    return value
+
+
+@lru_cache(maxsize=8)
+def _get_grid_pix(nside, xsize, rot, coord, nest, inv):
+    """Pixel indices of the rectangular projection grid.
+
+    The grid depends only on the projection geometry, not on the map, so
+    it is cached: repeated projview calls over the same geometry (e.g.
+    frequency sweeps) skip the rotator trig and ang2pix per frame.
+    """
+
+    ysize = xsize // 2
+    theta = np.linspace(np.pi, 0, ysize)
+    phi = np.linspace(-np.pi, np.pi, xsize)
+    PHI, THETA = np.meshgrid(phi, theta)
+    if coord or rot:
+        r = Rotator(coord=coord, rot=rot, inv=inv)
+        THETA, PHI = r(THETA.flatten(), PHI.flatten())
+        THETA = THETA.reshape(ysize, xsize)
+        PHI = PHI.reshape(ysize, xsize)
+
+    return ang2pix(nside, THETA, PHI, nest=nest)
+
+
 def projview(
     m=None,
     fig=None,
@@ -519,8 +575,6 @@ def projview(
         )
 
     ysize = xsize // 2
-    theta = np.linspace(np.pi, 0, ysize)
-    phi = np.linspace(-np.pi, np.pi, xsize)
 
     longitude = np.radians(np.linspace(-180, 180, xsize))
     if flip == "astro":
@@ -530,23 +584,22 @@ def projview(
         ax.healpy_flip = flip
 
     latitude = np.radians(np.linspace(-90, 90, ysize))
-    # project the map to a rectangular matrix xsize x ysize
-    PHI, THETA = np.meshgrid(phi, theta)
-    # coord or rotation
-    if coord or rot:
-        r = Rotator(coord=coord, rot=rot, inv=invRot)
-        THETA, PHI = r(THETA.flatten(), PHI.flatten())
-        THETA = THETA.reshape(ysize, xsize)
-        PHI = PHI.reshape(ysize, xsize)
     nside = npix2nside(len(m))
     if not m is None:
         w = ~(np.isnan(m) | np.isinf(m))
         if not m is None:
             # auto min and max
-            if min is None:
-                min = m[w].min()
-            if max is None:
-                max = m[w].max()
+            if min is None or max is None:
+                amin, amax = _finite_minmax(
+                    np.ma.getdata(m).ravel(),
+                    np.ma.getmaskarray(m).ravel()
+                    if np.ma.isMaskedArray(m)
+                    else np.zeros(0, dtype=np.bool_),
+                )
+                if min is None:
+                    min = amin
+                if max is None:
+                    max = amax
 
         cm, nn = get_color_table(
             min,
@@ -558,7 +611,10 @@ def projview(
             bgcolor=bgcolor,
             **norm_dict_defaults,
         )
-        grid_pix = ang2pix(nside, THETA, PHI, nest=nest)
+        # project the map to a rectangular matrix xsize x ysize
+        grid_pix = _get_grid_pix(
+            nside, xsize, _rot_key(rot), _rot_key(coord), nest, invRot
+        )
         grid_map = m[grid_pix]
 
         # plot
@@ -581,7 +581,10 @@ def getspec(nu, fg, params, function, field, nside, npix, idx, m):
         N = 1000
         map_ = np.zeros((N, npix))
 
-        for i, nu_ in enumerate(tqdm(nu, desc = fg, ncols=80)):
+        # Refresh the progress bar in ~1% chunks; per-iteration updates
+        # cost a measurable fraction of the loop when the per-frequency
+        # work is small.
+        for i, nu_ in enumerate(tqdm(nu, desc = fg, ncols=80, miniters=len(nu) // 100, mininterval=0.5)):
             if fg == "Spinning Dust":
                 map_[i, idx] = getattr(tls, function)(nu_, *params[:,idx], fnu, f_) #fgs.fg(nu, *params[pix])
             else:
@@ -84,6 +84,24 @@ def get_bandpass_coefficient(
     return coefficient
 
 
+def _trapezoid_weights(freqs: Quantity) -> Quantity:
+    """Trapezoidal quadrature weights for a set of frequency samples.
+
+    Turns `np.trapz(y, freqs)` into the dot product
+    `y @ _trapezoid_weights(freqs)`, so that the bandpass weights can be
+    folded into the quadrature vector once per integration instead of
+    multiplying every integrand (one temporary per interpolation grid
+    point in the gridded integrations).
+    """
+
+    quad_weights = np.zeros(freqs.shape)
+    delta = np.diff(freqs.value)
+    quad_weights[:-1] += 0.5 * delta
+    quad_weights[1:] += 0.5 * delta
+
+    return Quantity(quad_weights, unit=freqs.unit)
+
+
 class FreqScalingFunc(Protocol):
     """Protocol defining the interface of the `get_freq_scaling` function of a SkyComponent."""
 
@@ -150,8 +168,12 @@ def integrated_freq_scaling(
     varying spectral parameters.
     """
 
+    quad_weights = weights * _trapezoid_weights(freqs)
     freq_scaling = freq_scaling_func(freqs, **spectral_parameters)
-    scaling_factor = np.trapz(freq_scaling * weights, freqs)
+    if np.ndim(freq_scaling) == 0:
+        scaling_factor = freq_scaling * quad_weights.sum()
+    else:
+        scaling_factor = freq_scaling @ quad_weights
     if np.ndim(scaling_factor) > 0:
         return np.expand_dims(scaling_factor, axis=1)
 
@@ -177,12 +199,13 @@ def bandpass_interpolation_1d(
     else:
         integrals = np.zeros((len(spectral_parameter_grid), 1))
 
+    quad_weights = weights * _trapezoid_weights(freqs)
+    scalar_params = {
+        param: value for param, value in spectral_parameters.items() if param != key
+    }
     for idx, grid_point in enumerate(spectral_parameter_grid):
-        scalar_params = {
-            param: value for param, value in spectral_parameters.items() if param != key
-        }
         freq_scaling = freq_scaling_func(freqs, **{key: grid_point}, **scalar_params)
-        integrals[idx] = np.trapz(freq_scaling * weights, freqs)
+        integrals[idx] = freq_scaling @ quad_weights
 
     # We transpose the array to make it into row format similar to how
     # regular IQU maps are stored
@@ -229,11 +252,12 @@ def bandpass_interpolation_2d(
     else:
         integrals = np.zeros((n, n, 1))
 
+    quad_weights = weights * _trapezoid_weights(freqs)
     for i in range(n):
         for j in range(n):
             grid_spectrals = {key: value[i, j] for key, value in mesh_grid.items()}
             freq_scaling = freq_scaling_func(freqs, **grid_spectrals)
-            integrals[i, j] = np.trapz(freq_scaling * weights, freqs)
+            integrals[i, j] = freq_scaling @ quad_weights
     integrals = np.transpose(integrals)
 
     scaling = []
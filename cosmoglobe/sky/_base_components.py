@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, Optional, Tuple
 import warnings
 
@@ -53,6 +54,12 @@ class SkyComponent(ABC):
         freq_ref: Quantity,
         **spectral_parameters: Quantity,
     ):
+        # Amplitude maps are stored channel-major (1 or 3, `npix`) and
+        # must be C-contiguous so that the per-frequency scaling in the
+        # emission methods vectorizes over one unbroken buffer.
+        if isinstance(amp, Quantity) and not amp.value.flags["C_CONTIGUOUS"]:
+            amp = Quantity(np.ascontiguousarray(amp.value), unit=amp.unit)
+
         self.amp = amp
         self.freq_ref = freq_ref
         self.spectral_parameters = spectral_parameters
@@ -121,11 +128,6 @@ class SkyComponent(ABC):
             Bandpass integrated emission.
         """
 
-    @quantity_input(
-        freqs="Hz",
-        weights=("K_RJ", "K_CMB", "Jy/sr", None),
-        fwhm=("deg", "arcmin", "rad"),
-    )
     def simulate_emission(
         self,
         freqs: Quantity,
@@ -156,12 +158,33 @@ class SkyComponent(ABC):
             Bandpass integrated emission.
         """
 
+        # Manual input validation; the quantity_input decorator
+        # re-inspects the signature and rebuilds its unit checks on every
+        # call, which is measurable when sweeping frequencies over small
+        # or cached maps.
+        if not isinstance(freqs, Quantity):
+            raise TypeError("freqs must be of type `astropy.units.Quantity`")
+        if not freqs.unit.is_equivalent("Hz"):
+            raise UnitsError("freqs must have units compatible with Hz")
+        if weights is not None:
+            if not isinstance(weights, Quantity):
+                raise TypeError("weights must be of type `astropy.units.Quantity`")
+            if not any(weights.unit.is_equivalent(unit) for unit in SIGNAL_UNITS):
+                raise UnitsError(
+                    "weights must have units compatible with one of "
+                    f"{', '.join(unit.to_string() for unit in SIGNAL_UNITS)}"
+                )
+        if not isinstance(fwhm, Quantity):
+            raise TypeError("fwhm must be of type `astropy.units.Quantity`")
+        if not fwhm.unit.is_equivalent("rad"):
+            raise UnitsError("fwhm must have units compatible with rad")
+
         if not any(unit.is_equivalent(output_unit) for unit in SIGNAL_UNITS):
             raise UnitsError(
                 "output unit must be one of "
                 f"{', '.join(unit.to_string() for unit in SIGNAL_UNITS)}"
             )
-        
+
 
         # If the emission from the sky component is negligable at the
         # frequencies given by `freqs`, we simply return 0.
@@ -195,9 +218,13 @@ class SkyComponent(ABC):
             nside=nside,
         )
 
-    @property
+    @cached_property
     def is_polarized(self) -> bool:
-        """Returns True if component emits polarized signal and False otherwise."""
+        """Returns True if component emits polarized signal and False otherwise.
+
+        The amplitude shape is fixed after validation, so the flag is
+        computed once and cached on first access.
+        """
 
         return self.amp.shape[0] == 3
 
@@ -250,6 +277,11 @@ class DiffuseComponent(SkyComponent):
         self._validate_amp(amp)
         self._validate_spectral_parameters(spectral_parameters)
 
+        # The amplitude map is fixed after validation; caching its nside
+        # saves the model-level checks from re-deriving it from the pixel
+        # count for every component.
+        self._nside: int = hp.get_nside(self.amp)
+
     @abstractmethod
     def get_freq_scaling(
         self, freqs: Quantity, **spectral_parameters: Quantity
@@ -275,9 +307,21 @@ class DiffuseComponent(SkyComponent):
     def get_delta_emission(self, freq: Quantity, output_unit: Unit, **_) -> Quantity:
         """See base class."""
 
-        emission = self.amp * self.get_freq_scaling(freq, **self.spectral_parameters)
+        scaling = self.get_freq_scaling(freq, **self.spectral_parameters)
+
+        # The scaling is dimensionless and the unit conversion at a single
+        # frequency is a linear scale factor, so both are folded into one
+        # multiply over the full (3, npix) map. Scaling in amplitude units
+        # and converting afterwards would allocate the map twice and do
+        # the unit bookkeeping per operation.
+        factor = Quantity(1.0, unit=self.amp.unit).to_value(
+            output_unit, equivalencies=cmb_equivalencies(freq)
+        )
 
-        return emission.to(output_unit, equivalencies=cmb_equivalencies(freq))
+        return Quantity(
+            np.multiply(self.amp.value, scaling.to_value("") * factor),
+            unit=output_unit,
+        )
 
     def get_bandpass_emission(
         self, freqs: Quantity, weights: Quantity, output_unit: Unit, **_
@@ -296,14 +340,22 @@ class DiffuseComponent(SkyComponent):
             freq_scaling_func=self.get_freq_scaling,
             spectral_parameters=self.spectral_parameters,
         )
-        emission = self.amp * bandpass_scaling
         unit_coefficient = get_bandpass_coefficient(
             freqs=freqs,
             weights=normalized_weights,
-            input_unit=emission.unit,
+            input_unit=self.amp.unit,
             output_unit=output_unit,
         )
-        emission *= unit_coefficient
+
+        # The bandpass scaling and the (scalar) unit coefficient are folded
+        # into a single factor before touching the (3, npix) amplitude map,
+        # leaving one full-map multiply instead of two and skipping the
+        # per-operation Quantity bookkeeping.
+        scaling = np.asarray(bandpass_scaling) * unit_coefficient.value
+        emission = Quantity(
+            np.multiply(self.amp.value, scaling),
+            unit=self.amp.unit * unit_coefficient.unit,
+        )
 
         # Converts to the correct prefix
         if emission != output_unit:
@@ -392,6 +444,16 @@ class PointSourceComponent(SkyComponent):
             )
         self._validate_spectral_parameters(spectral_parameters)
 
+        # The catalog is fixed over the lifetime of the component, so the
+        # Cartesian source vectors consumed by the beam mapping are
+        # computed once here rather than on every emission call. The
+        # packed disc pixels are likewise memoized per (nside, truncation
+        # radius) across emission calls.
+        self._source_vectors = hp.ang2vec(
+            *self.catalog.to("deg").value, lonlat=True
+        )
+        self._disc_cache: Dict[Tuple[int, float], Tuple[np.ndarray, np.ndarray]] = {}
+
     @abstractmethod
     def get_freq_scaling(
         self, freqs: Quantity, **spectral_parameters: Quantity
@@ -427,9 +489,19 @@ class PointSourceComponent(SkyComponent):
             catalog=self.catalog,
             nside=nside,
             fwhm=fwhm,
+            source_vectors=self._source_vectors,
+            disc_cache=self._disc_cache,
+        )
+
+        # The unit conversion at a single frequency is a linear scale
+        # factor, so it is applied in place on the freshly mapped emission
+        # rather than walking the full map again through Quantity.to.
+        factor = Quantity(1.0, unit=emission.unit).to_value(
+            output_unit, equivalencies=cmb_equivalencies(freq)
         )
+        np.multiply(emission.value, factor, out=emission.value)
 
-        return emission.to(output_unit, equivalencies=cmb_equivalencies(freq))
+        return Quantity(emission.value, unit=output_unit)
 
     def get_bandpass_emission(
         self,
@@ -459,6 +531,8 @@ class PointSourceComponent(SkyComponent):
             catalog=self.catalog,
             nside=nside,
             fwhm=fwhm,
+            source_vectors=self._source_vectors,
+            disc_cache=self._disc_cache,
         )
         input_unit = emission.unit
         unit_coefficient = get_bandpass_coefficient(
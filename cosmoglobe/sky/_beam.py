@@ -1,12 +1,19 @@
 import warnings
+from functools import lru_cache
 from math import log, pi, sqrt
+from typing import Dict, Optional, Tuple
 
 import healpy as hp
 import numpy as np
 from astropy.units import Quantity, Unit, quantity_input
+from numba import njit
 
 from cosmoglobe.sky._constants import DEFAULT_BEAM_FWHM
 
+# Conversion factor between the FWHM and the standard deviation of a
+# Gaussian beam.
+_FWHM_TO_SIGMA = 1 / (2 * sqrt(2 * log(2)))
+
 
 @quantity_input(fwhm=("rad", "arcmin", "deg"))
 def get_sigma(fwhm: Quantity) -> Quantity:
@@ -22,7 +29,7 @@ def get_sigma(fwhm: Quantity) -> Quantity:
         Standard deviation of the beam.
     """
 
-    return fwhm / (2 * sqrt(2 * log(2)))
+    return fwhm * _FWHM_TO_SIGMA
 
 
 def gaussian_beam_2D(r: np.ndarray, sigma: float) -> np.ndarray:
@@ -43,16 +50,110 @@ def gaussian_beam_2D(r: np.ndarray, sigma: float) -> np.ndarray:
     return np.exp(-(r ** 2) / (2 * sigma ** 2)) / (sigma * np.sqrt(2 * np.pi))
 
 
+@lru_cache(maxsize=4)
+def _pixel_vectors(nside: int) -> np.ndarray:
+    """Unit vectors of all pixels as a contiguous (npix, 3) array.
+
+    The array is invariant across sources, frequencies and bandpass
+    samples, and the trig-heavy pix2vec is the single largest fixed cost
+    of the beam mapping, so it is memoized per nside (one (npix, 3)
+    float64 array per cached nside).
+    """
+
+    return np.ascontiguousarray(
+        np.asarray(hp.pix2vec(nside, np.arange(hp.nside2npix(nside)))).T
+    )
+
+
+@njit(
+    "void(float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], "
+    "int64[::1], int64[::1], float64)",
+    cache=True,
+    fastmath=True,
+)
+def _accumulate_sources(
+    emission, amps, source_vectors, pixel_vectors, pixels, offsets, sigma
+):
+    """Scatter-adds the truncated Gaussian beams onto the emission map.
+
+    The disc pixels of all sources are packed back-to-back: source `idx`
+    covers pixels[offsets[idx]:offsets[idx + 1]]. Compiling the
+    accumulation removes the per-source Python and small-array overhead;
+    discs of nearby sources overlap, so the scatter-add stays serial
+    rather than racing threads on shared pixels. The explicit signature
+    declares every array C-contiguous, letting the compiler emit the
+    same gather/SIMD-friendly loads a typed C kernel would, and skips
+    type inference when the cached binary is loaded.
+    """
+
+    norm = 1.0 / (sigma * np.sqrt(2.0 * np.pi))
+    inv_two_sigma2 = 1.0 / (2.0 * sigma ** 2)
+    for idx in range(amps.shape[1]):
+        for k in range(offsets[idx], offsets[idx + 1]):
+            pixel = pixels[k]
+            # The squared angular distance follows from the chord length
+            # through r = 2 arcsin(c / 2); the second-order series
+            # r^2 = c^2 (1 + c^2 / 12) is accurate to <1e-9 relative at
+            # beam-truncation radii and avoids the arccos per pixel.
+            dx = pixel_vectors[pixel, 0] - source_vectors[idx, 0]
+            dy = pixel_vectors[pixel, 1] - source_vectors[idx, 1]
+            dz = pixel_vectors[pixel, 2] - source_vectors[idx, 2]
+            chord2 = dx * dx + dy * dy + dz * dz
+            r2 = chord2 * (1.0 + chord2 / 12.0)
+            beam = np.exp(-r2 * inv_two_sigma2) * norm
+            for IQU in range(amps.shape[0]):
+                emission[IQU, pixel] += amps[IQU, idx] * beam
+
+
+def _disc_indices(
+    nside: int, source_vectors: np.ndarray, r_max: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Disc pixels of all sources packed back-to-back in CSR layout.
+
+    Source `idx` covers pixels[offsets[idx]:offsets[idx + 1]]. The disc
+    pixels are remapped onto the compressed union of hit pixels, so the
+    accumulation can run on a dense (nhit,) buffer instead of scattering
+    into the full map; `hit_pixels` maps the buffer back onto the map
+    and `hit_vectors` holds the corresponding pixel unit vectors.
+    """
+
+    discs = [
+        hp.query_disc(nside, source_vector, r_max)
+        for source_vector in source_vectors
+    ]
+    offsets = np.zeros(len(discs) + 1, dtype=np.int64)
+    np.cumsum([disc.size for disc in discs], out=offsets[1:])
+    hit_pixels, local_pixels = np.unique(np.concatenate(discs), return_inverse=True)
+    hit_vectors = np.ascontiguousarray(_pixel_vectors(nside)[hit_pixels])
+
+    return (
+        np.ascontiguousarray(local_pixels, dtype=np.int64),
+        offsets,
+        hit_pixels,
+        hit_vectors,
+    )
+
+
 def pointsources_to_healpix(
     point_sources: Quantity,
     catalog: Quantity,
     nside: int,
     fwhm: Quantity,
+    source_vectors: Optional[np.ndarray] = None,
+    disc_cache: Optional[Dict[Tuple[int, float], Tuple[np.ndarray, np.ndarray]]] = None,
 ) -> Quantity:
     """Maps the point sources to a HEALPIX map.
 
     For more information on this calculation, please see `Mitra et al. (2010)
     <https://arxiv.org/pdf/1005.1929.pdf>`_.
+
+    If `source_vectors` is given, it must contain the Cartesian unit
+    vectors of the cataloged sources as an (nsources, 3) array, saving the
+    per-call coordinate transform for callers with a fixed catalog. Such
+    callers may additionally pass a `disc_cache` dictionary in which the
+    packed disc pixels are memoized per (nside, truncation radius),
+    saving the query_disc searches when the same catalog is mapped
+    repeatedly at a fixed beam.
     """
 
     N_FWHM = 2  # FWHM cutoff for the truncated beam
@@ -82,28 +183,47 @@ def pointsources_to_healpix(
 
     # Applying a truncated Gaussian beam to each point source
     else:
-        sigma = get_sigma(fwhm)
+        sigma = fwhm.value * _FWHM_TO_SIGMA
         if fwhm.value < hp.nside2resol(nside):
             raise ValueError(
                 "fwhm must be >= pixel resolution to resolve the point sources."
             )
 
         r_max = N_FWHM * fwhm.value
-        pixel_lon, pixel_lat = hp.pix2ang(
-            nside, np.arange(hp.nside2npix(nside)), lonlat=True
-        )
 
-        lons, lats = catalog
-        for idx, (lon, lat) in enumerate(zip(lons, lats)):
-            vec = hp.ang2vec(lon, lat, lonlat=True)
-            pixels = hp.query_disc(nside, vec, r_max)
-            angular_distance = hp.rotator.angdist(
-                [pixel_lon[pixels], pixel_lat[pixels]], [lon, lat], lonlat=True
+        # Unit vectors for all sources in one vectorized call, and for all
+        # pixels as an (npix, 3) array. The angular distances then reduce
+        # to arccos of a dot product over the disc pixels, replacing the
+        # per-source hp.rotator.angdist / pix2ang trigonometry.
+        if source_vectors is None:
+            source_vectors = hp.ang2vec(*catalog, lonlat=True)
+
+        # The disc pixels are gathered per source and packed back-to-back
+        # so the whole accumulation runs in one compiled kernel call. The
+        # kernel works on the compressed union of hit pixels (typically a
+        # small fraction of the sky for a truncated beam) and the result
+        # is scattered into the full map once at the end.
+        if disc_cache is not None:
+            key = (nside, round(r_max, 8))
+            if key not in disc_cache:
+                disc_cache[key] = _disc_indices(nside, source_vectors, r_max)
+            local_pixels, offsets, hit_pixels, hit_vectors = disc_cache[key]
+        else:
+            local_pixels, offsets, hit_pixels, hit_vectors = _disc_indices(
+                nside, source_vectors, r_max
             )
-            beam = gaussian_beam_2D(angular_distance, sigma.value)
-            for IQU, emission in enumerate(point_sources):
-                healpix_map[IQU, pixels] += emission[idx] * beam
+        hit_emission = np.zeros((point_sources.shape[0], hit_pixels.size))
+        _accumulate_sources(
+            hit_emission,
+            np.ascontiguousarray(point_sources.value, dtype=np.float64),
+            np.ascontiguousarray(source_vectors, dtype=np.float64),
+            hit_vectors,
+            local_pixels,
+            offsets,
+            sigma,
+        )
+        healpix_map.value[:, hit_pixels] = hit_emission
 
-        beam_area = 2 * pi * sigma ** 2
+        beam_area = (2 * pi * sigma ** 2) * Unit("rad") ** 2
 
         return healpix_map / beam_area
@@ -34,13 +34,16 @@ def reshape_freq_ref(args: Dict[str, Quantity]) -> Dict[str, Quantity]:
     """Context that re-shapes the `freq_ref` attribute for unpolarized components."""
 
     if "freq_ref" in args:
-        args["freq_ref"] = args["freq_ref"].to("GHz")
+        # Reshaped on the bare array; slicing and reshaping through
+        # Quantity re-enters the subclass machinery per operation.
+        freq_ref = args["freq_ref"].to_value("GHz")
         if (amp_dim := args["amp"].shape[0]) == 1:
-            args["freq_ref"] = args["freq_ref"][0].reshape((1, 1))
+            freq_ref = np.reshape(freq_ref[0], (1, 1))
         elif amp_dim == 3:
-            args["freq_ref"] = args["freq_ref"].reshape((3, 1))
+            freq_ref = np.reshape(freq_ref, (3, 1))
         else:
             raise ValueError("cannot reshape freq_ref into shape (3,1) or (1,1")
+        args["freq_ref"] = Quantity(freq_ref, unit="GHz")
 
     return args
 
@@ -1,11 +1,13 @@
 import inspect
+import os
 import warnings
-from typing import Dict, List, Literal, Optional, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import healpy as hp
 import numpy as np
 from astropy.units import Quantity, Unit
-from tqdm import tqdm
 
 from cosmoglobe.h5._exceptions import (
     ChainComponentNotFoundError,
@@ -19,10 +21,17 @@ from cosmoglobe.sky._base_components import (
     SkyComponent,
 )
 from cosmoglobe.sky._chain_context import chain_context_registry
+from cosmoglobe.sky._sht import alm2map
 from cosmoglobe.sky.cosmoglobe import DEFAULT_COSMOGLOBE_MODEL, CosmoglobeModel
 
 DEFAULT_SAMPLE = -1
 
+# Number of threads used to extract component arguments (chain reads and
+# alm synthesis) concurrently. healpy/libsharp release the GIL during the
+# transforms, so the independent per-argument SHTs overlap. Set to 1 to
+# force serial extraction.
+SHT_THREADS = int(os.environ.get("COSMOGLOBE_SHT_THREADS", 2))
+
 
 def get_components_from_chain(
     chain: Union[str, Chain],
@@ -31,6 +40,7 @@ def get_components_from_chain(
     model: CosmoglobeModel = DEFAULT_COSMOGLOBE_MODEL,
     samples: Optional[Union[range, int, Literal["all"]]] = DEFAULT_SAMPLE,
     burn_in: Optional[int] = None,
+    dtype: Optional[type] = None,
 ) -> Dict[str, SkyComponent]:
     """Initialize and return a cosmoglobe sky model from a chainfile.
 
@@ -51,6 +61,11 @@ def get_components_from_chain(
         Defaults to the last sample in the chain.
     burn_in
         Burn in sample for which all previous samples are disregarded.
+    dtype
+        If given (e.g. `np.float32`), the extracted maps are stored in
+        this dtype, halving the memory footprint and bandwidth of all
+        downstream emission simulations at the cost of precision. If
+        None, the maps keep the chainfile dtype.
 
     Returns
     -------
@@ -88,6 +103,10 @@ def get_components_from_chain(
                     "but not found in chain."
                 )
 
+    # tqdm is only needed for this progress bar; importing it lazily keeps
+    # it (and its dependency chain) off the package import path.
+    from tqdm import tqdm
+
     initialized_components: Dict[str, SkyComponent] = {}
     with tqdm(total=len(components), ncols=75) as progress_bar:
         padding = len(max(chain.components, key=len))
@@ -100,7 +119,7 @@ def get_components_from_chain(
                     f"{component=!r} is not part in the Cosmoglobe Sky Model"
                 )
             initialized_components[component] = get_comp_from_chain(
-                chain, nside, component, component_class, samples
+                chain, nside, component, component_class, samples, dtype
             )
             progress_bar.update()
 
@@ -113,6 +132,7 @@ def get_comp_from_chain(
     component_label: str,
     component_class: Type[SkyComponent],
     samples: Optional[Union[range, int]] = None,
+    dtype: Optional[type] = None,
 ) -> SkyComponent:
     """Initialize and return a sky component from a chainfile.
 
@@ -129,6 +149,8 @@ def get_comp_from_chain(
     samples
         A range object, or an int representing the samples to use from the
         chain.
+    dtype
+        If given, the extracted maps are cast to this dtype.
 
     Returns
     -------
@@ -136,7 +158,6 @@ def get_comp_from_chain(
     """
 
     class_args = get_comp_signature(component_class)
-    args: Dict[str, Quantity] = {}
 
     # Chain contexts are operations that we perform on the data in the chain
     # to fit it to the format required in the Cosmoglobe Sky Model. This includes,
@@ -144,67 +165,121 @@ def get_comp_from_chain(
     # and/or converting maps constant over the sky to scalars.
     parameter_mappings = chain_context_registry.get_parameter_mappings(component_class)
     units = chain_context_registry.get_units(component_class)
-    for arg in class_args:
+
+    # The parameter group of the component is the same for every argument;
+    # bind it once instead of looking it up per extracted argument.
+    chain_params = chain.parameters[component_label]
+
+    # Listing the component group once lets each argument resolve its
+    # chainfile item by name instead of probing the candidates with
+    # try/except reads, where every failed probe opened the file.
+    available_items = set(chain[f"{chain.samples[0]}/{component_label}"])
+
+    # The component beam is shared by every synthesized argument, so the
+    # arcmin -> rad conversion is done once here as a plain float rather
+    # than rebuilding the Quantity inside each extraction.
+    if "fwhm" in chain_params:
+        fwhm_rad = (chain_params["fwhm"] * Unit("arcmin")).to_value("rad")
+    else:
+        fwhm_rad = 0.0
+
+    def extract_arg(arg: str) -> Quantity:
         chain_arg = parameter_mappings.get(arg, arg)
-        chain_params = chain.parameters[component_label]
 
         if chain_arg in chain_params:
             value = chain_params[chain_arg]
         else:
-            is_alm = True if chain_arg == "amp" else False
-            if is_alm:
-                try:
-                    value = chain.mean(
-                        f"{component_label}/{chain_arg}_alm", samples=samples
-                    )
-                except ChainKeyError:
-                    # Component is radio
-                    try:
-                        value = chain.mean(
-                            f"{component_label}/{chain_arg}", samples=samples
-                        )
-                    except ChainKeyError:
-                        value = chain.mean(
-                            f"{component_label}/{chain_arg}_map", samples=samples
-                        )
-                    is_alm = False
+            if chain_arg == "amp":
+                # The amp of most components is stored as alms; radio
+                # stores the point source amplitudes directly.
+                candidates = (f"{chain_arg}_alm", chain_arg, f"{chain_arg}_map")
             else:
-                try:
-                    value = chain.mean(
-                        f"{component_label}/{chain_arg}", samples=samples
-                    )
-                except ChainKeyError:
-                    value = chain.mean(
-                        f"{component_label}/{chain_arg}_map", samples=samples
-                    )
+                candidates = (chain_arg, f"{chain_arg}_map")
+            for item in candidates:
+                if item in available_items:
+                    break
+            else:
+                raise ChainKeyError(
+                    f"{component_label}/{chain_arg} does not exist in the chain"
+                )
+            is_alm = item.endswith("_alm")
+            value = chain.mean(f"{component_label}/{item}", samples=samples)
 
             nside_out = nside if nside is not None else chain_params["nside"]
             if is_alm:
                 pol = True if arg == "amp" and value.shape[0] == 3 else False
-                lmax = chain.get(f"{component_label}/{chain_arg}_lmax", samples=0)
-                value = hp.alm2map(
+                lmax = int(chain.get(f"{component_label}/{chain_arg}_lmax", samples=0))
+                # Synthesis cost scales as lmax^3, so alms are truncated
+                # when the model is initialized below the chain's native
+                # resolution; the discarded multipoles are sub-pixel at
+                # nside_out. Commander chains store amp_lmax = 3 * nside,
+                # so 3 * nside_out as the cutoff leaves native-resolution
+                # initialization untouched.
+                target_lmax = 3 * nside_out
+                if target_lmax < lmax:
+                    value = value[..., hp.Alm.getlm(lmax)[0] <= target_lmax]
+                    lmax = target_lmax
+                if dtype is np.float32:
+                    # complex64 alms run the synthesis in single
+                    # precision and come out as float32 maps directly.
+                    value = value.astype(np.complex64)
+                # The polarized triple is synthesized in one batched,
+                # multithreaded transform; batching across components is
+                # not possible since lmax and fwhm differ per component.
+                value = alm2map(
                     value,
                     nside=nside_out,
                     lmax=lmax,
-                    fwhm=(chain_params["fwhm"] * Unit("arcmin")).to("rad").value,
+                    fwhm=fwhm_rad,
                     pol=pol,
                 )
             else:
                 try:
-                    hp.npix2nside(value[0].size)
-                    value = np.asarray(
-                        [
-                            hp.ud_grade(
-                                value[IQU], nside_out=nside_out
-                            )
-                            for IQU in range(value.shape[0])
-                        ]
-                    )
+                    nside_in = hp.npix2nside(value[0].size)
                 except ValueError:
                     pass
-
-
-        args[arg] = Quantity(value, unit=units[arg] if arg in units else None)
+                # Maps already at the model resolution are left alone;
+                # hp.ud_grade would just copy them in a full-npix pass.
+                else:
+                    if nside_in != nside_out:
+                        rows = list(value)
+                        if len(rows) > 1:
+                            # The IQU rows are independent and numpy
+                            # releases the GIL in the resampling core, so
+                            # they are regraded concurrently.
+                            with ThreadPoolExecutor(max_workers=len(rows)) as pool:
+                                rows = list(
+                                    pool.map(
+                                        lambda row: hp.ud_grade(
+                                            row, nside_out=nside_out
+                                        ),
+                                        rows,
+                                    )
+                                )
+                        else:
+                            rows = [hp.ud_grade(rows[0], nside_out=nside_out)]
+                        value = np.asarray(rows)
+
+        if (
+            dtype is not None
+            and isinstance(value, np.ndarray)
+            and np.issubdtype(value.dtype, np.floating)
+        ):
+            # astype(copy=False) is a no-op when the chain already stores
+            # this dtype; otherwise the float64 intermediate is dropped
+            # right after the cast instead of living on in the component.
+            value = value.astype(dtype, copy=False)
+
+        return Quantity(value, unit=units[arg] if arg in units else None)
+
+    # The per-argument extractions are independent of each other; run them
+    # concurrently so their SHTs and HDF5 reads overlap.
+    if SHT_THREADS > 1 and len(class_args) > 1:
+        with ThreadPoolExecutor(max_workers=SHT_THREADS) as executor:
+            values = list(executor.map(extract_arg, class_args))
+    else:
+        values = [extract_arg(arg) for arg in class_args]
+    args: Dict[str, Quantity] = dict(zip(class_args, values))
 
     functions = chain_context_registry.get_functions(component_class)
     for function in functions:
@@ -213,8 +288,13 @@ def get_comp_from_chain(
     return component_class(**args)
 
 
-def get_comp_signature(comp_class: Type[SkyComponent]) -> List[str]:
-    """Extracts and returns the parameters to extract from the chain."""
+@lru_cache(maxsize=None)
+def get_comp_signature(comp_class: Type[SkyComponent]) -> Tuple[str, ...]:
+    """Extracts and returns the parameters to extract from the chain.
+
+    The signature is purely a function of the class, so the inspection
+    is memoized per component class.
+    """
 
     EXCLUDE = [
         "self",
@@ -230,6 +310,4 @@ def get_comp_signature(comp_class: Type[SkyComponent]) -> List[str]:
         SED_signature = inspect.signature((comp_class.get_freq_scaling))
         arguments.extend(list(SED_signature.parameters.keys()))
 
-    arguments = [arg for arg in arguments if arg not in EXCLUDE]
-
-    return arguments
+    return tuple(arg for arg in arguments if arg not in EXCLUDE)
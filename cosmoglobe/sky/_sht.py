@@ -0,0 +1,336 @@
+"""Thin wrappers around the spherical harmonic transforms used in Cosmoglobe.
+
+The transforms are routed through `ducc0.sht` when ducc0 is installed,
+which is multithreaded and reuses its FFT plans across rings, making it
+significantly faster than the healpy equivalents on the SHT-bound paths
+(alm synthesis and map smoothing). When ducc0 is not available, we fall
+back to the healpy implementations.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+import healpy as hp
+import numpy as np
+
+try:
+    import ducc0
+except ImportError:
+    ducc0 = None
+
+DEFAULT_NTHREADS = os.cpu_count() or 1
+
+
+def _sht_geometry(nside: int) -> dict:
+    """Returns the ducc0 SHT geometry info for a RING ordered HEALPIX grid."""
+
+    return ducc0.healpix.Healpix_Base(nside, "RING").sht_info()
+
+
+def alm2map(
+    alm: np.ndarray,
+    nside: int,
+    lmax: int,
+    fwhm: float = 0.0,
+    pol: bool = False,
+    pixwin: bool = False,
+    nthreads: Optional[int] = None,
+) -> np.ndarray:
+    """Synthesizes a HEALPIX map from a set of alms.
+
+    Drop-in replacement for `healpy.alm2map` dispatching spin-0 transforms
+    for intensity and a spin-2 transform for (Q, U) when `pol` is True.
+
+    Parameters
+    ----------
+    alm
+        Complex alm array of shape (nalm,), (1, nalm) or (3, nalm).
+    nside
+        nside of the output HEALPIX map.
+    lmax
+        Maximum multipole moment of the alms.
+    fwhm
+        The full width half max parameter of the Gaussian [radians].
+    pol
+        If True and alm has three components, they are assumed to be
+        (T, E, B) and transformed to (I, Q, U).
+    pixwin
+        If True, the alms are convolved with the HEALPIX pixel window
+        function.
+    nthreads
+        Number of threads used in the transforms. Defaults to the number
+        of available cores.
+
+    Returns
+    -------
+        The synthesized HEALPIX map. complex64 alms are transformed in
+        single precision and yield a float32 map, halving the memory
+        bandwidth of the synthesis; any other dtype runs in double
+        precision.
+    """
+
+    if ducc0 is None:
+        return hp.alm2map(
+            np.asarray(alm, dtype=np.complex128),
+            nside=nside,
+            lmax=lmax,
+            mmax=lmax,
+            fwhm=fwhm,
+            pol=pol,
+            pixwin=pixwin,
+        )
+
+    if nthreads is None:
+        nthreads = DEFAULT_NTHREADS
+
+    scalar_input = np.ndim(alm) == 1
+    alm = np.atleast_2d(alm)
+    single_precision = alm.dtype == np.complex64
+    if single_precision:
+        alm = np.ascontiguousarray(alm)
+    else:
+        alm = np.ascontiguousarray(alm, dtype=np.complex128)
+
+    if fwhm > 0.0 or pixwin:
+        beam = hp.gauss_beam(fwhm, lmax=lmax, pol=True) if fwhm > 0.0 else None
+        if pixwin:
+            # healpy's default pixel window carries l = 0 .. 3*nside - 1
+            # and hp.alm2map(pixwin=True) zeroes every multipole beyond
+            # it; truncate or zero-pad to lmax + 1 to match that exactly
+            # instead of requesting the extended window from hp.pixwin.
+            pixwin_T, pixwin_P = (
+                np.pad(pw[: lmax + 1], (0, max(0, lmax + 1 - pw.size)))
+                for pw in hp.pixwin(nside, pol=True)
+            )
+        # The window is applied as a gather over the (memoized) l of each
+        # alm index, which preserves the input precision (hp.almxfl would
+        # promote complex64 to complex128).
+        ls = hp.Alm.getlm(lmax)[0]
+        filtered = np.empty_like(alm, order="C")
+        for idx, component in enumerate(alm):
+            fl = np.ones(lmax + 1)
+            if beam is not None:
+                fl = fl * beam[:, idx if pol else 0]
+            if pixwin:
+                fl = fl * (pixwin_P if pol and idx > 0 else pixwin_T)
+            np.multiply(component, fl[ls], out=filtered[idx])
+        alm = filtered
+
+    geometry = _sht_geometry(nside)
+    map_dtype = np.float32 if single_precision else np.float64
+    maps = np.empty((alm.shape[0], hp.nside2npix(nside)), dtype=map_dtype)
+    if pol and alm.shape[0] == 3:
+        ducc0.sht.synthesis(
+            alm=alm[:1], map=maps[:1], lmax=lmax, spin=0, nthreads=nthreads, **geometry
+        )
+        ducc0.sht.synthesis(
+            alm=alm[1:], map=maps[1:], lmax=lmax, spin=2, nthreads=nthreads, **geometry
+        )
+    else:
+        for idx in range(alm.shape[0]):
+            ducc0.sht.synthesis(
+                alm=alm[idx : idx + 1],
+                map=maps[idx : idx + 1],
+                lmax=lmax,
+                spin=0,
+                nthreads=nthreads,
+                **geometry,
+            )
+
+    return maps[0] if scalar_input else maps
+
+
+@lru_cache(maxsize=8)
+def _alm_weights(lmax: int) -> np.ndarray:
+    """Weights of the real scalar product over packed alms.
+
+    m > 0 coefficients count twice since the m < 0 half is implicit.
+    Derived from the (l, m) layout of healpy's alm ordering, which only
+    depends on lmax, so the table is memoized per lmax.
+    """
+
+    return np.where(hp.Alm.getlm(lmax)[1] == 0, 1.0, 2.0)
+
+
+def _quadrature_alm(
+    map_: np.ndarray,
+    lmax: int,
+    pol: bool = False,
+    nthreads: Optional[int] = None,
+) -> np.ndarray:
+    """Quadrature estimate of the alms of a HEALPIX map.
+
+    Equivalent to `healpy.map2alm(map_, iter=0)`: an adjoint synthesis
+    scaled by the (equal) HEALPIX pixel area. For a polarized (3, npix)
+    map with `pol` set, the rows are treated as (I, Q, U) and the output
+    rows as (T, E, B).
+    """
+
+    if ducc0 is None:
+        return hp.map2alm(map_, lmax=lmax, iter=0, pol=pol)
+
+    if nthreads is None:
+        nthreads = DEFAULT_NTHREADS
+
+    scalar_input = map_.ndim == 1
+    map_ = np.ascontiguousarray(np.atleast_2d(map_))
+    npix = map_.shape[-1]
+    geometry = _sht_geometry(hp.npix2nside(npix))
+    alm = np.empty((map_.shape[0], hp.Alm.getsize(lmax)), dtype=np.complex128)
+    if pol and map_.shape[0] == 3:
+        ducc0.sht.adjoint_synthesis(
+            map=map_[:1], alm=alm[:1], lmax=lmax, spin=0, nthreads=nthreads, **geometry
+        )
+        ducc0.sht.adjoint_synthesis(
+            map=map_[1:], alm=alm[1:], lmax=lmax, spin=2, nthreads=nthreads, **geometry
+        )
+    else:
+        for idx in range(map_.shape[0]):
+            ducc0.sht.adjoint_synthesis(
+                map=map_[idx : idx + 1],
+                alm=alm[idx : idx + 1],
+                lmax=lmax,
+                spin=0,
+                nthreads=nthreads,
+                **geometry,
+            )
+
+    alm *= 4 * np.pi / npix
+
+    return alm[0] if scalar_input else alm
+
+
+def map2alm(
+    map_: np.ndarray,
+    lmax: Optional[int] = None,
+    pol: bool = False,
+    tol: float = 1e-6,
+    maxiter: int = 20,
+    nthreads: Optional[int] = None,
+) -> np.ndarray:
+    """Computes the alms of a HEALPIX map with a conjugate-gradient solver.
+
+    `healpy.map2alm` refines its quadrature estimate with a fixed number
+    of Jacobi-style iterations (default 3), each costing one full
+    alm2map + map2alm pair. Solving the normal equations with conjugate
+    gradients instead converges to a requested residual in fewer SHT
+    pairs for the same accuracy.
+
+    Parameters
+    ----------
+    map_
+        A HEALPIX map of shape (npix,) or (3, npix).
+    lmax
+        Maximum multipole moment of the output alms. Defaults to the
+        healpy convention 3 * nside - 1.
+    pol
+        If True and the map has three rows, they are assumed to be
+        (I, Q, U) and the output alms are (T, E, B).
+    tol
+        Relative residual at which the iteration stops.
+    maxiter
+        Maximum number of conjugate-gradient iterations.
+    nthreads
+        Number of threads used in the transforms.
+
+    Returns
+    -------
+        The alms of the map.
+    """
+
+    map_ = np.ascontiguousarray(np.asarray(map_, dtype=np.float64))
+    nside = hp.npix2nside(map_.shape[-1])
+    if lmax is None:
+        lmax = 3 * nside - 1
+
+    weights = _alm_weights(lmax)
+
+    def dot(x: np.ndarray, y: np.ndarray) -> float:
+        return float(np.sum(weights * (x * y.conjugate()).real))
+
+    def matvec(alm: np.ndarray) -> np.ndarray:
+        return _quadrature_alm(
+            alm2map(alm, nside, lmax, pol=pol, nthreads=nthreads),
+            lmax,
+            pol=pol,
+            nthreads=nthreads,
+        )
+
+    alms = _quadrature_alm(map_, lmax, pol=pol, nthreads=nthreads)
+    norm = np.sqrt(dot(alms, alms))
+    residual = alms - matvec(alms)
+    direction = residual.copy()
+    residual_norm2 = dot(residual, residual)
+    for _ in range(maxiter):
+        if np.sqrt(residual_norm2) <= tol * norm:
+            break
+        mat_direction = matvec(direction)
+        step = residual_norm2 / dot(direction, mat_direction)
+        alms += step * direction
+        residual -= step * mat_direction
+        new_residual_norm2 = dot(residual, residual)
+        direction = residual + (new_residual_norm2 / residual_norm2) * direction
+        residual_norm2 = new_residual_norm2
+
+    return alms
+
+
+def smoothing(
+    map_: np.ndarray,
+    fwhm: float,
+    lmax: Optional[int] = None,
+    pol: bool = False,
+    tol: float = 1e-6,
+    maxiter: int = 20,
+    nthreads: Optional[int] = None,
+) -> np.ndarray:
+    """Smooths a HEALPIX map with a Gaussian beam.
+
+    Equivalent to `healpy.smoothing`, but uses the conjugate-gradient
+    analysis above and the (multithreaded) ducc0 synthesis rather than
+    healpy's fixed-iteration map2alm -> almxfl -> alm2map pipeline.
+
+    Parameters
+    ----------
+    map_
+        A HEALPIX map of shape (npix,) or (3, npix).
+    fwhm
+        The full width half max parameter of the Gaussian [radians].
+    lmax
+        Maximum multipole moment used in the transforms. Defaults to the
+        healpy convention 3 * nside - 1.
+    pol
+        If True and the map has three rows, they are smoothed as a
+        polarized (I, Q, U) set with the polarized beam window.
+
+    Returns
+    -------
+        The smoothed map.
+    """
+
+    # Bad/masked pixels are zeroed before the analysis and the mask is
+    # re-applied to the output, matching the healpy.smoothing behaviour
+    # where masked (or UNSEEN) input yields masked output.
+    mask = None
+    if isinstance(map_, np.ma.MaskedArray):
+        mask = np.ma.getmaskarray(map_)
+        map_ = map_.filled(0.0)
+    bad = hp.mask_bad(map_)
+    if bad.any():
+        mask = bad if mask is None else mask | bad
+        map_ = np.where(bad, 0.0, map_)
+
+    nside = hp.npix2nside(map_.shape[-1])
+    if lmax is None:
+        lmax = 3 * nside - 1
+
+    alms = map2alm(
+        map_, lmax=lmax, pol=pol, tol=tol, maxiter=maxiter, nthreads=nthreads
+    )
+
+    smoothed = alm2map(alms, nside, lmax, fwhm=fwhm, pol=pol, nthreads=nthreads)
+    if mask is not None:
+        return np.ma.array(smoothed, mask=mask, copy=False, fill_value=hp.UNSEEN)
+
+    return smoothed
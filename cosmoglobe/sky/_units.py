@@ -5,6 +5,7 @@ them our selves. In the following code, we follow the implementation in pysm3
 Reference: https://github.com/galsci/pysm/blob/main/pysm3/__init__.py
 """
 
+from functools import lru_cache
 from typing import Any, List
 
 from astropy.units import (
@@ -22,12 +23,33 @@ from astropy.units import (
 def cmb_equivalencies(freqs: Quantity) -> List[Any]:
     """Custom equivalency representing the conversion between Kelvin Rayleigh-Jeans and CMB units.
 
+    For a single frequency, the equivalency list is memoized since
+    simulation and plotting workflows tend to convert repeatedly at the
+    same small set of frequencies, and building the equivalencies
+    involves evaluating the Planck derivative factor each time.
+
     Parameters
     ----------
     freqs
         Frequencies at which to perform the conversion.
     """
 
+    if freqs.size == 1:
+        return _scalar_cmb_equivalencies(freqs.to_value("Hz").item())
+
+    return _build_cmb_equivalencies(freqs)
+
+
+@lru_cache(maxsize=256)
+def _scalar_cmb_equivalencies(freq_hz: float) -> List[Any]:
+    """Memoized equivalencies for a single frequency given in Hz."""
+
+    return _build_cmb_equivalencies(Quantity(freq_hz, unit="Hz"))
+
+
+def _build_cmb_equivalencies(freqs: Quantity) -> List[Any]:
+    """Constructs the K_RJ/K_CMB/Jy equivalency list for a set of frequencies."""
+
     [(_, _, Jy_to_CMB, CMB_to_Jy)] = thermodynamic_temperature(freqs)
     [(_, _, Jy_to_RJ, RJ_to_Jy)] = brightness_temperature(freqs)
 
@@ -39,12 +39,15 @@ class ModifiedBlackbody(DiffuseComponent):
     ) -> Quantity:
         """See base class."""
 
-        blackbody_ratio = blackbody_emission(freqs, T) / blackbody_emission(
-            self.freq_ref, T
-        )
-        scaling = (freqs / self.freq_ref) ** (beta - 2) * blackbody_ratio
-
-        return scaling
+        # The scaling is dimensionless, so the modified blackbody is
+        # evaluated on bare arrays and the unit attached once, avoiding
+        # Quantity unit checks on the full spectral parameter maps.
+        blackbody_ratio = (
+            blackbody_emission(freqs, T) / blackbody_emission(self.freq_ref, T)
+        ).to_value("")
+        freq_ratio = (freqs / self.freq_ref).to_value("")
+
+        return Quantity(freq_ratio ** (beta.value - 2) * blackbody_ratio)
 
 
 @quantity_input(freq="Hz", T="K")
@@ -30,10 +30,15 @@ class LinearOpticallyThin(DiffuseComponent):
     def get_freq_scaling(self, freqs: Quantity, T_e: Quantity) -> Quantity:
         """See base class."""
 
-        gaunt_factor_ratio = gaunt_factor(freqs, T_e) / gaunt_factor(self.freq_ref, T_e)
-        scaling = (self.freq_ref / freqs) ** 2 * gaunt_factor_ratio
-
-        return scaling
+        # The scaling is dimensionless, so it is evaluated on bare arrays
+        # and the unit attached once, avoiding Quantity unit checks on the
+        # full electron temperature map.
+        gaunt_factor_ratio = (
+            gaunt_factor(freqs, T_e) / gaunt_factor(self.freq_ref, T_e)
+        ).to_value("")
+        freq_ratio = (self.freq_ref / freqs).to_value("")
+
+        return Quantity(freq_ratio ** 2 * gaunt_factor_ratio)
 
 
 @quantity_input(freq="Hz", T_e="K")
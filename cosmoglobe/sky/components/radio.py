@@ -36,6 +36,9 @@ class AGNPowerLaw(PointSourceComponent):
     def get_freq_scaling(self, freqs: Quantity, alpha: Quantity) -> Quantity:
         """See base class."""
 
-        scaling = (freqs / self.freq_ref) ** (alpha - 2)
+        # The scaling is dimensionless, so the power law is evaluated on
+        # bare arrays and the unit attached once, avoiding Quantity unit
+        # checks on the per-source spectral index array.
+        freq_ratio = (freqs / self.freq_ref).to_value("")
 
-        return scaling
+        return Quantity(freq_ratio ** (alpha.value - 2))
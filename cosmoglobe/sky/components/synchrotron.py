@@ -32,4 +32,9 @@ class PowerLaw(DiffuseComponent):
     def get_freq_scaling(self, freqs: Quantity, beta: Quantity) -> Quantity:
         """See base class."""
 
-        return (freqs / self.freq_ref) ** beta
+        # The scaling is dimensionless, so the power law is evaluated on
+        # bare arrays and the unit attached once, avoiding Quantity unit
+        # checks on the full spectral index map.
+        freq_ratio = (freqs / self.freq_ref).to_value("")
+
+        return Quantity(freq_ratio ** beta.value)
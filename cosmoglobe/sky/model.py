@@ -25,6 +25,7 @@ from cosmoglobe.sky._exceptions import (
     ComponentNotFoundError,
     NsideError,
 )
+from cosmoglobe.sky._sht import smoothing
 from cosmoglobe.sky._units import Unit
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 from cosmoglobe.sky.cosmoglobe import cosmoglobe_registry
@@ -99,7 +100,8 @@ class SkyModel:
             raise ComponentError("all components must be subclasses of SkyComponent")
 
         if not all(
-            self.nside == hp.get_nside(component.amp)
+            self.nside
+            == (getattr(component, "_nside", None) or hp.get_nside(component.amp))
             for component in components.values()
             if not isinstance(component, PointSourceComponent)
         ):
@@ -116,6 +118,7 @@ class SkyModel:
         model: str = "BeyondPlanck",
         samples: Union[range, int, Literal["all"]] = -1,
         burn_in: Optional[int] = None,
+        dtype: Optional[type] = None,
     ) -> SkyModel:
         """Initializes the SkyModel from a Cosmoglobe chain.
 
@@ -135,6 +138,10 @@ class SkyModel:
             Defaults to the last sample in the chain.
         burn_in
             Burn in sample for which all previous samples are disregarded.
+        dtype
+            If given (e.g. `np.float32`), the component maps are stored in
+            this dtype, halving the memory footprint of the model at the
+            cost of precision.
 
         Returns
         -------
@@ -150,6 +157,7 @@ class SkyModel:
             model=cosmoglobe_model,
             samples=samples,
             burn_in=burn_in,
+            dtype=dtype,
         )
 
         return cls(
@@ -164,6 +172,19 @@ class SkyModel:
 
         raise NotImplementedError
 
+    @property
+    def components(self) -> Dict[str, SkyComponent]:
+        """Dictionary of the sky components in the Sky Model."""
+
+        return self._components
+
+    @components.setter
+    def components(self, value: Dict[str, SkyComponent]) -> None:
+        """Materializes the component tuple iterated by the hot loops."""
+
+        self._components = value
+        self._components_tuple = tuple(value.values())
+
     @property
     def nside(self) -> int:
         """HEALPIX map resolution of the maps in the Sky Model."""
@@ -181,6 +202,9 @@ class SkyModel:
             raise TypeError("nside must be an integer")
 
         self._nside = int(value)
+        # npix is fixed by the nside; caching it here keeps the
+        # per-emission calls from re-deriving it on every invocation.
+        self._npix = hp.nside2npix(self._nside)
 
     def __call__(
         self,
@@ -190,6 +214,7 @@ class SkyModel:
         components: Optional[List[str]] = None,
         fwhm: Quantity = DEFAULT_BEAM_FWHM,
         output_unit: str = DEFAULT_OUTPUT_UNIT_STR,
+        dtype: Optional[type] = None,
     ) -> Quantity:
         r"""Simulates and returns the full sky model emission.
 
@@ -213,8 +238,13 @@ class SkyModel:
             The full width half max parameter of the Gaussian. Defaults to
             0.0, which indicates no smoothing of output maps.
         output_unit
-            The output units of the emission. For instance 'uK_RJ', 'uK_CMB', 
+            The output units of the emission. For instance 'uK_RJ', 'uK_CMB',
             or 'MJy/sr'. If Kelvin, Rayleigh-Jeans or CMB must be specified.
+        dtype
+            Dtype of the output emission map. Defaults to float64. Passing
+            `np.float32` halves the memory traffic of the accumulation and
+            of the returned map, at a precision well below the uncertainty
+            of the component maps.
 
         Returns
         -------
@@ -223,7 +253,7 @@ class SkyModel:
         """
 
         if components is None:
-            included_components = list(self.components.values())
+            included_components = self._components_tuple
         else:
             if not all(component in self.components for component in components):
                 raise ValueError("all component must be present in the model")
@@ -242,40 +272,112 @@ class SkyModel:
                 pointsource_components.append(component_class)
 
         emission_unit = Unit(output_unit)
-        emission = Quantity(np.zeros((3, hp.nside2npix(self.nside))), unit=emission_unit)
+        emission = Quantity(
+            np.zeros((3, self._npix), dtype=dtype), unit=emission_unit
+        )
+
+        def accumulate(component_emission: Quantity) -> None:
+            """Adds a component emission to the model emission in place.
+
+            The component emissions are already in the model output unit,
+            so the accumulation runs on the bare arrays in one fused add
+            per component instead of a per-Stokes Quantity loop.
+            """
+
+            value = component_emission.to_value(emission_unit)
+            if value.ndim == 1:
+                value = value[:, np.newaxis]
+            rows = emission.value[: value.shape[0]]
+            np.add(rows, value, out=rows)
 
         for diffuse_component in diffuse_components:
-            component_emission = diffuse_component.simulate_emission(
-                freqs=freqs,
-                weights=weights,
-                nside=self.nside,
-                fwhm=fwhm,
-                output_unit=emission_unit,
+            accumulate(
+                diffuse_component.simulate_emission(
+                    freqs=freqs,
+                    weights=weights,
+                    nside=self.nside,
+                    fwhm=fwhm,
+                    output_unit=emission_unit,
+                )
             )
-            for IQU, diffuse_emission in enumerate(component_emission):
-                emission[IQU] += diffuse_emission
 
-        # We smooth all diffuse components together in a single smoothing operation.
-        if fwhm != DEFAULT_BEAM_FWHM:
+        # We smooth all diffuse components together in a single smoothing
+        # operation. If no diffuse component is included, the summed map is
+        # still zero and the transforms would be wasted.
+        if fwhm != DEFAULT_BEAM_FWHM and diffuse_components:
+            # The transforms run in float64; the result is cast back to the
+            # requested dtype of the accumulation buffer.
+            smoothed = smoothing(emission.value, fwhm.to("rad").value, pol=True)
             emission = Quantity(
-                hp.smoothing(emission, fwhm=fwhm.to("rad").value), unit=emission.unit
+                smoothed.astype(emission.value.dtype, copy=False),
+                unit=emission.unit,
             )
 
         # Pointsource emissions are already smoothed during the stage where 
         # each source is mapped to the HEALPIX map.
         for pointsource_component in pointsource_components:
-            component_emission = pointsource_component.simulate_emission(
-                freqs=freqs,
-                weights=weights,
-                nside=self.nside,
-                fwhm=fwhm,
-                output_unit=emission_unit,
+            accumulate(
+                pointsource_component.simulate_emission(
+                    freqs=freqs,
+                    weights=weights,
+                    nside=self.nside,
+                    fwhm=fwhm,
+                    output_unit=emission_unit,
+                )
             )
-            for IQU, pointsource_emission in enumerate(component_emission):
-                emission[IQU] += pointsource_emission
 
         return emission
 
+    def simulate_spectrum(
+        self,
+        freqs: Quantity,
+        *,
+        components: Optional[List[str]] = None,
+        fwhm: Quantity = DEFAULT_BEAM_FWHM,
+        output_unit: str = DEFAULT_OUTPUT_UNIT_STR,
+        dtype: Optional[type] = None,
+    ) -> Quantity:
+        r"""Simulates the sky emission over a set of delta frequencies.
+
+        Each frequency is simulated as a delta peak (no bandpass
+        integration) and the maps are written into one preallocated
+        (nfreqs, 3, npix) block, avoiding the per-frequency Quantity
+        construction and intermediate lists of a Python-level loop over
+        ``model(freq)``.
+
+        Parameters
+        ----------
+        freqs
+            The frequencies for which to simulate the sky emission.
+        components
+            List of component labels. If None, all components in the sky
+            model is included. Defaults to None.
+        fwhm
+            The full width half max parameter of the Gaussian. Defaults to
+            0.0, which indicates no smoothing of output maps.
+        output_unit
+            The output units of the emission.
+        dtype
+            Dtype of the output block. Defaults to float64.
+
+        Returns
+        -------
+        emission
+            The simulated emission of shape (nfreqs, 3, npix).
+        """
+
+        freqs = np.atleast_1d(freqs)
+        emission = np.empty((freqs.size, 3, self._npix), dtype=dtype)
+        for idx, freq in enumerate(freqs):
+            emission[idx] = self(
+                freq,
+                components=components,
+                fwhm=fwhm,
+                output_unit=output_unit,
+            ).value
+
+        return Quantity(emission, unit=Unit(output_unit))
+
     def remove_dipole(
         self,
         gal_cut: Quantity = DEFAULT_GAL_CUT,
@@ -310,27 +412,24 @@ class SkyModel:
                 "gal_cut must be an astropy quantity compatible with 'deg'"
             )
 
+        # The fit and subtraction are done on the bare array view of the
+        # amplitude map; subtracting Quantities would allocate full-map
+        # temporaries and re-check units per operation.
+        amp = self["cmb"].amp.value[0]
+
         if return_dipole:
-            dipole_subtracted_amp = Quantity(
-                hp.remove_dipole(
-                    self["cmb"].amp[0],
-                    gal_cut=gal_cut.to("deg").value,
-                ),
-                unit=self["cmb"].amp.unit,
-            )
-            dipole = self["cmb"].amp[0] - dipole_subtracted_amp
-            self["cmb"].amp[0] = dipole_subtracted_amp
+            dipole = amp.copy()
+            hp.remove_dipole(amp, gal_cut=gal_cut.to("deg").value, copy=False)
+            np.subtract(dipole, amp, out=dipole)
 
-            return dipole
+            return Quantity(dipole, unit=self["cmb"].amp.unit)
 
-        hp.remove_dipole(
-            self["cmb"].amp[0], gal_cut=gal_cut.to("deg").value, copy=False
-        )
+        hp.remove_dipole(amp, gal_cut=gal_cut.to("deg").value, copy=False)
 
     def __iter__(self) -> Iterator:
         """Returns an iterator over the model components."""
 
-        return iter(list(self.components.values()))
+        return iter(self._components_tuple)
 
     def __getitem__(self, key: str) -> SkyComponent:
         """Returns a SkyComponent class."""
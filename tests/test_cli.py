@@ -0,0 +1,19 @@
+import importlib
+
+from cosmoglobe.__main__ import COMMAND_SOURCES, LAZY_SOURCES
+
+
+def test_lazy_sources_match_groups():
+    """The lazy registry must list exactly the commands of each group."""
+
+    for module_name, group_name, command_names in LAZY_SOURCES:
+        group = getattr(importlib.import_module(module_name), group_name)
+        assert sorted(command_names) == sorted(group.commands)
+
+
+def test_lazy_commands_resolve():
+    """Every registered command must be retrievable from its source group."""
+
+    for name, (module_name, group_name) in COMMAND_SOURCES.items():
+        group = getattr(importlib.import_module(module_name), group_name)
+        assert group.get_command(None, name) is not None
@@ -0,0 +1,39 @@
+import healpy as hp
+import numpy as np
+import pytest
+
+from cosmoglobe.sky._sht import alm2map
+
+NSIDE = 16
+
+
+def _random_alms(lmax, ncomp):
+    rng = np.random.default_rng(42)
+    size = hp.Alm.getsize(lmax)
+    return rng.standard_normal((ncomp, size)) + 1j * rng.standard_normal(
+        (ncomp, size)
+    )
+
+
+@pytest.mark.parametrize("lmax", [3 * NSIDE - 1, 3 * NSIDE])
+def test_alm2map_matches_healpy(lmax):
+    """The wrapper must be a drop-in replacement for hp.alm2map.
+
+    lmax = 3 * nside exercises the multipole band beyond healpy's default
+    pixel window, which hp.alm2map(pixwin=True) zeroes.
+    """
+
+    alm = _random_alms(lmax, 3)
+    maps = alm2map(alm, nside=NSIDE, lmax=lmax, fwhm=0.01, pol=True, pixwin=True)
+    expected = hp.alm2map(
+        alm.copy(), nside=NSIDE, lmax=lmax, mmax=lmax, fwhm=0.01, pol=True, pixwin=True
+    )
+    assert np.allclose(maps, expected, atol=1e-10 * np.abs(expected).max())
+
+
+def test_alm2map_unpolarized_matches_healpy():
+    lmax = 3 * NSIDE
+    alm = _random_alms(lmax, 1)[0]
+    maps = alm2map(alm, nside=NSIDE, lmax=lmax, pixwin=True)
+    expected = hp.alm2map(alm.copy(), nside=NSIDE, lmax=lmax, mmax=lmax, pixwin=True)
+    assert np.allclose(maps, expected, atol=1e-10 * np.abs(expected).max())
@@ -115,3 +115,21 @@ def test_inputs(sky_model):
             [10, 11] * Unit("GHz"),
             weights=[11, 12, 13] * DEFAULT_OUTPUT_UNIT,
         )
+
+
+def test_simulate_spectrum(sky_model):
+    """Tests the batched multi-frequency simulation."""
+
+    freqs = [100, 120] * Unit("GHz")
+    emission = sky_model.simulate_spectrum(freqs, components=["dust"])
+    assert emission.shape == (2, 3, hp.nside2npix(sky_model.nside))
+    assert np.array_equal(
+        emission[0].value,
+        sky_model(freqs[0], components=["dust"]).value,
+        equal_nan=True,
+    )
+
+    emission = sky_model.simulate_spectrum(
+        freqs, components=["dust"], dtype=np.float32
+    )
+    assert emission.value.dtype == np.float32